@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""Long-running HTTP front-end that keeps providers and caches warm across jobs."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import threading
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Callable
+
+from classes.audio_export import FfmpegWriter
+from classes.config import AppConfig
+from classes.speech_synthesizer import SpeechSynthesizer
+from classes.subtitle_service import SubtitleService
+from classes.tts_factory import create_tts_provider
+from classes.tts_providers import TTSProvider
+from main import (
+    build_pipeline,
+    create_argument_parser,
+    load_environment,
+    prewarm_cache,
+    resolve_output_path,
+)
+
+# Request fields forwarded to the CLI parser, so jobs accept the same options as main.py.
+JOB_FIELDS = {
+    "srt_path": "--srt-path",
+    "job_name": "--job-name",
+    "provider": "--provider",
+    "out": "--out",
+    "model": "--model",
+    "voice": "--voice",
+    "format": "--format",
+    "batch_size": "--batch-size",
+    "instructions": "--instructions",
+    "force_language": "--force-language",
+}
+# Provider settings and job names come from request bodies, and each synthesizer
+# holds its own in-memory audio cache, so only the most recently used few
+# providers and synthesizers are kept warm.
+MAX_WARM_SERVICES = 4
+
+
+class WarmServices:
+    """Reuse provider clients and synthesizers (with their in-memory caches) across jobs."""
+
+    def __init__(self) -> None:
+        self._providers: OrderedDict[tuple[object, int], TTSProvider] = OrderedDict()
+        self._synthesizers: OrderedDict[tuple[object, int, Path], SpeechSynthesizer] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def synthesizer_for(self, config: AppConfig) -> SpeechSynthesizer:
+        # Provider configs are frozen dataclasses, so they identify a client setup.
+        provider_key = (config.provider_config, config.batch_size)
+        key = (*provider_key, config.cache_dir)
+        with self._lock:
+            provider = _get_or_create(self._providers, provider_key, lambda: create_tts_provider(config))
+            return _get_or_create(
+                self._synthesizers,
+                key,
+                lambda: SpeechSynthesizer(provider=provider, cache_dir=config.cache_dir),
+            )
+
+    def run_job(self, payload: dict) -> Path:
+        """Convert one SRT file described by a request payload and return the output path."""
+        argv: list[str] = []
+        for field, flag in JOB_FIELDS.items():
+            value = payload.get(field)
+            if value is not None:
+                argv.extend([flag, str(value)])
+
+        args = create_argument_parser().parse_args(argv)
+        config = AppConfig.from_args(args)
+
+        if not config.srt_path.exists():
+            raise FileNotFoundError(f"Input file not found: {config.srt_path}")
+
+        subtitle_service = SubtitleService(
+            transliterate=config.transliterate,
+            cache_dir=config.cache_dir,
+            dump_transliterated=config.dump_transliterated,
+        )
+        subtitles = subtitle_service.load(config.srt_path)
+
+        synthesizer = self.synthesizer_for(config)
+        pipeline = build_pipeline(config, synthesizer)
+        if not config.async_prefetch:
+            prewarm_cache(
+                synthesizer,
+                pipeline.unique_chunks(subtitles),
+                config.concurrency,
+                show_progress=False,
+                batch_size=config.batch_size,
+            )
+        output_path = resolve_output_path(args, config)
+        output_format = output_path.suffix.lstrip(".") or synthesizer.output_format
+        pipeline.export(subtitles, FfmpegWriter(output_path, output_format))
+        return output_path
+
+
+def _get_or_create(entries: OrderedDict, key: object, factory: Callable[[], object]) -> object:
+    """Return the cached entry for ``key`` (creating it on a miss), evicting the least recently used."""
+    entry = entries.get(key)
+    if entry is not None:
+        entries.move_to_end(key)
+        return entry
+    entry = entries[key] = factory()
+    if len(entries) > MAX_WARM_SERVICES:
+        entries.popitem(last=False)
+    return entry
+
+
+def make_handler(services: WarmServices) -> type[BaseHTTPRequestHandler]:
+    class JobHandler(BaseHTTPRequestHandler):
+        def do_POST(self) -> None:
+            if self.path != "/synthesize":
+                self._reply(404, {"error": f"Unknown endpoint '{self.path}'."})
+                return
+
+            try:
+                length = int(self.headers.get("Content-Length", 0))
+                payload = json.loads(self.rfile.read(length) or b"{}")
+                if not isinstance(payload, dict):
+                    raise ValueError("Request body must be a JSON object.")
+                output_path = services.run_job(payload)
+            except (ValueError, FileNotFoundError) as exc:
+                self._reply(400, {"error": str(exc)})
+            except SystemExit:
+                # argparse exits on invalid choices (e.g. an unknown provider).
+                self._reply(400, {"error": "Invalid job options."})
+            except Exception as exc:  # pragma: no cover - surfaced to the client
+                self._reply(500, {"error": str(exc)})
+            else:
+                self._reply(200, {"output": str(output_path)})
+
+        def _reply(self, status: int, body: dict) -> None:
+            data = json.dumps(body).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+    return JobHandler
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Serve SRT-to-audio jobs over HTTP, keeping TTS clients and caches warm between jobs."
+    )
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to bind (default 127.0.0.1).")
+    parser.add_argument("--port", type=int, default=8000, help="Port to listen on (default 8000).")
+    args = parser.parse_args(argv)
+
+    load_environment()
+    server = ThreadingHTTPServer((args.host, args.port), make_handler(WarmServices()))
+    print(f"Listening on http://{args.host}:{args.port}/synthesize")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,94 @@
+"""Stream raw PCM into an encoded audio file through an ffmpeg subprocess."""
+
+from __future__ import annotations
+
+import subprocess
+import tempfile
+from pathlib import Path
+
+from pydub import AudioSegment
+from pydub.exceptions import CouldntEncodeError
+
+# ffmpeg input formats for the sample widths the pipeline produces.
+_PCM_FORMATS = {2: "s16le", 4: "s32le"}
+# Same default codecs pydub's export picks for containers ffmpeg cannot infer one for.
+_DEFAULT_CODECS = {"ogg": "libvorbis"}
+
+
+class FfmpegWriter:
+    """Encode PCM to ``output_path`` while it is being produced.
+
+    ffmpeg is started once the sample format is known (``open``) and fed over
+    stdin, so encoding overlaps with synthesis and assembly instead of running
+    after the whole track exists in memory.
+    """
+
+    def __init__(self, output_path: Path, audio_format: str) -> None:
+        self.output_path = output_path
+        self.audio_format = audio_format
+        self._process: subprocess.Popen | None = None
+        self._stderr = None
+
+    def open(self, frame_rate: int, channels: int, sample_width: int) -> None:
+        pcm_format = _PCM_FORMATS.get(sample_width)
+        if pcm_format is None:
+            raise ValueError(f"Unsupported PCM sample width: {sample_width} bytes.")
+
+        command = [
+            AudioSegment.converter,
+            "-y",
+            "-loglevel",
+            "error",
+            "-f",
+            pcm_format,
+            "-ar",
+            str(frame_rate),
+            "-ac",
+            str(channels),
+            "-i",
+            "pipe:0",
+        ]
+        codec = _DEFAULT_CODECS.get(self.audio_format)
+        if codec:
+            command.extend(["-acodec", codec])
+        command.extend(["-f", self.audio_format, str(self.output_path)])
+
+        # stderr goes to a temp file rather than a pipe nobody reads until the end,
+        # so a long encode can never stall on a full stderr pipe.
+        self._stderr = tempfile.TemporaryFile()
+        self._process = subprocess.Popen(command, stdin=subprocess.PIPE, stderr=self._stderr)
+
+    def write(self, data: bytes | memoryview) -> None:
+        try:
+            self._process.stdin.write(data)
+        except OSError:
+            # ffmpeg exited early (BrokenPipeError); surface its own error message.
+            self.close()
+            raise
+
+    def close(self) -> None:
+        """Finish the file and wait for ffmpeg to exit."""
+        self._process.communicate()
+        stderr = self._read_stderr()
+        if self._process.returncode != 0:
+            raise CouldntEncodeError(
+                f"ffmpeg failed to encode {self.output_path} "
+                f"(exit code {self._process.returncode}): {stderr.decode(errors='replace')}"
+            )
+
+    def abort(self) -> None:
+        """Stop ffmpeg after a failure; the partial output is left behind."""
+        if self._process is not None:
+            self._process.kill()
+            self._process.wait()
+        self._read_stderr()
+
+    def _read_stderr(self) -> bytes:
+        """Return what ffmpeg logged and release the temp file."""
+        if self._stderr is None:
+            return b""
+        self._stderr.seek(0)
+        stderr = self._stderr.read()
+        self._stderr.close()
+        self._stderr = None
+        return stderr
@@ -2,14 +2,122 @@
 
 from __future__ import annotations
 
-from typing import Sequence
+import asyncio
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Iterable, Iterator, List, Sequence
 
 import math
 import srt
 from pydub import AudioSegment
 
+from .audio_export import FfmpegWriter
 from .speech_synthesizer import SpeechSynthesizer
-from .utils import change_playback_speed, chunk_text, timedelta_to_ms
+from .utils import chunk_text, mp3_duration_ms, resample_pcm, timedelta_to_ms
+
+# Shared block of silence (about 5.5 s at 48 kHz stereo 16-bit); gaps are copied
+# from zero-copy views of it instead of allocating a fresh buffer per gap.
+_ZEROS = memoryview(bytes(1 << 20))
+
+
+class _PcmTrack:
+    """Append-only raw PCM buffer that is turned into one ``AudioSegment`` at the end.
+
+    Concatenating immutable ``AudioSegment`` objects copies the whole track on every
+    append, so the pipeline writes raw samples into a single ``bytearray`` instead.
+    The sample format is taken from the first speech segment; silence requested
+    before that point is remembered and written once the format is known. With a
+    ``writer`` the samples are streamed to it rather than kept in memory.
+    """
+
+    def __init__(self, writer: FfmpegWriter | None = None) -> None:
+        self._buffer = bytearray()
+        self._writer = writer
+        self._write = writer.write if writer is not None else self._buffer.extend
+        self._pending_silence_ms = 0
+        self.frame_rate: int | None = None
+        self.channels: int | None = None
+        self.sample_width: int | None = None
+        self._frame_width = 0
+
+    def conform(self, segments: Sequence[AudioSegment]) -> AudioSegment:
+        """Join speech chunks into one segment using the track's sample format."""
+        if self.frame_rate is None:
+            first = segments[0]
+            # Silence used to be 16-bit pydub audio, so never go below that width;
+            # 24-bit input is widened to 32-bit so NumPy can address the samples.
+            self._set_format(first.frame_rate, first.channels, 2 if first.sample_width <= 2 else 4)
+
+        raw = b"".join(
+            segment.set_frame_rate(self.frame_rate)
+            .set_channels(self.channels)
+            .set_sample_width(self.sample_width)
+            .raw_data
+            for segment in segments
+        )
+        return self._wrap(raw)
+
+    def change_speed(self, segment: AudioSegment, speed: float) -> AudioSegment:
+        """Resample a conformed segment to play ``speed`` times faster."""
+        return self._wrap(resample_pcm(segment.raw_data, self.sample_width, self.channels, speed))
+
+    def append_silence(self, duration_ms: int) -> None:
+        if duration_ms <= 0:
+            return
+        if self.frame_rate is None:
+            self._pending_silence_ms += duration_ms
+            return
+        self._append_zeros(self._ms_to_bytes(duration_ms))
+
+    def append_speech(self, segment: AudioSegment, max_ms: int | None = None) -> int:
+        """Append a conformed segment, optionally cut to ``max_ms``; return the appended length."""
+        raw = segment.raw_data
+        length_ms = len(segment)
+        if max_ms is not None and length_ms > max_ms:
+            raw = raw[: self._ms_to_bytes(max_ms)]
+            length_ms = max_ms
+        self._write(raw)
+        return length_ms
+
+    def to_segment(self) -> AudioSegment:
+        if self.frame_rate is None:
+            return AudioSegment.silent(duration=self._pending_silence_ms)
+        return self._wrap(bytes(self._buffer))
+
+    def finish(self) -> None:
+        """Flush a streamed track and let the writer finalize its file."""
+        if self.frame_rate is None:
+            # No speech at all: write the silence in pydub's default silent format.
+            silence = AudioSegment.silent(duration=0)
+            self._set_format(silence.frame_rate, silence.channels, silence.sample_width)
+        self._writer.close()
+
+    def _set_format(self, frame_rate: int, channels: int, sample_width: int) -> None:
+        self.frame_rate = frame_rate
+        self.channels = channels
+        self.sample_width = sample_width
+        self._frame_width = channels * sample_width
+        if self._writer is not None:
+            self._writer.open(frame_rate, channels, sample_width)
+        self._append_zeros(self._ms_to_bytes(self._pending_silence_ms))
+        self._pending_silence_ms = 0
+
+    def _wrap(self, raw: bytes) -> AudioSegment:
+        return AudioSegment(
+            raw,
+            sample_width=self.sample_width,
+            frame_rate=self.frame_rate,
+            channels=self.channels,
+        )
+
+    def _ms_to_bytes(self, duration_ms: int) -> int:
+        return duration_ms * self.frame_rate // 1000 * self._frame_width
+
+    def _append_zeros(self, nbytes: int) -> None:
+        while nbytes > 0:
+            block = min(nbytes, len(_ZEROS))
+            self._write(_ZEROS[:block])
+            nbytes -= block
 
 
 class AudioPipeline:
@@ -24,6 +132,8 @@ class AudioPipeline:
         pad_trailing_ms: int,
         max_chars_per_call: int,
         max_speedup: float,
+        concurrency: int = 4,
+        async_prefetch: bool = False,
     ) -> None:
         self.synthesizer = synthesizer
         self.fill_to_end = fill_to_end
@@ -32,44 +142,142 @@ class AudioPipeline:
         self.pad_trailing_ms = max(0, pad_trailing_ms)
         self.max_chars_per_call = max_chars_per_call
         self.max_speedup = max(1.0, max_speedup)
+        self.concurrency = max(1, concurrency)
+        self.async_prefetch = async_prefetch
 
     def build(self, subtitles: Sequence[srt.Subtitle]) -> AudioSegment:
         """Assemble subtitles into a single audio track with proper timing.
 
         Iterates through subtitles, synthesizes speech, adjusts speed if needed,
-        and pads with silence to match subtitle durations.
+        and pads with silence to match subtitle durations. Synthesis requests are
+        dispatched to a thread pool ahead of assembly and consumed in subtitle order.
+        With ``async_prefetch`` every uncached chunk is first fetched on a single
+        asyncio event loop, so the pool only reads and decodes cached audio.
+        """
+        track = _PcmTrack()
+        self._run(subtitles, track)
+        return track.to_segment()
+
+    def export(self, subtitles: Sequence[srt.Subtitle], writer: FfmpegWriter) -> None:
+        """Assemble like ``build`` but stream the samples to ``writer`` as they are laid out.
+
+        Encoding then overlaps with synthesis, and the full track is never held in memory.
         """
-        final_audio = AudioSegment.silent(duration=0)
+        track = _PcmTrack(writer)
+        try:
+            self._run(subtitles, track)
+            track.finish()
+        except BaseException:
+            writer.abort()
+            raise
+
+    def _run(self, subtitles: Sequence[srt.Subtitle], track: _PcmTrack) -> None:
+        texts = [_subtitle_text(subtitle) for subtitle in subtitles]
+
+        if self.async_prefetch:
+            chunks = self.unique_chunks(subtitles)
+            asyncio.run(self.synthesizer.prefetch_async(chunks, self.concurrency))
+
+        executor = ThreadPoolExecutor(max_workers=self.concurrency)
+        try:
+            self._assemble(subtitles, self._dispatch(executor, subtitles, texts), track)
+        finally:
+            # Drop queued requests if assembly failed part-way through.
+            executor.shutdown(cancel_futures=True)
+
+    def unique_chunks(self, subtitles: Sequence[srt.Subtitle]) -> List[str]:
+        """Return every distinct text chunk the pipeline will synthesize, in first-seen order."""
+        chunks = (
+            chunk
+            for subtitle in subtitles
+            if (text := _subtitle_text(subtitle))
+            for chunk in chunk_text(text, max_chars=self.max_chars_per_call, strip=False)
+        )
+        return list(dict.fromkeys(chunks))
+
+    def _dispatch(
+        self,
+        executor: ThreadPoolExecutor,
+        subtitles: Sequence[srt.Subtitle],
+        texts: Sequence[str],
+    ) -> Iterator[Future[List[AudioSegment]] | None]:
+        """Yield one speech future per subtitle (None for blank subtitles), in order.
+
+        Requests are submitted lazily, a bounded window ahead of the subtitle being
+        assembled, so the workers stay busy without decoding the whole file up front.
+        """
+        lookahead = self.concurrency * 2
+        window: deque[Future[List[AudioSegment]] | None] = deque()
+        for subtitle, text in zip(subtitles, texts):
+            if text:
+                slot_length = max(0, timedelta_to_ms(subtitle.end) - timedelta_to_ms(subtitle.start))
+                window.append(executor.submit(self._synthesize_speech, text, slot_length))
+            else:
+                window.append(None)
+            if len(window) > lookahead:
+                yield window.popleft()
+        while window:
+            yield window.popleft()
+
+    def _synthesize_speech(self, text: str, slot_length: int) -> List[AudioSegment]:
+        """Fetch the encoded audio for every chunk of a subtitle, then decode it.
+
+        Each chunk is decoded on its own: complete MP3 files carry their own tags,
+        info frame and encoder delay, which would end up mid-stream if joined.
+        """
+        encoded = [
+            self.synthesizer.synthesize_bytes(chunk)
+            for chunk in chunk_text(text, max_chars=self.max_chars_per_call, strip=False)
+        ]
+
+        # A hard cut discards whatever still overruns the slot at maximum speed-up,
+        # so when the MP3 frame headers say that much is coming, skip decoding it.
+        if len(encoded) == 1 and self.fill_to_end and self.hard_cut and slot_length > 0:
+            audio_bytes, audio_format = encoded[0]
+            if audio_format == "mp3":
+                keep_ms = math.ceil(slot_length * self.max_speedup)
+                duration_ms = mp3_duration_ms(audio_bytes)
+                if duration_ms is not None and duration_ms > keep_ms:
+                    return [self.synthesizer.decode(audio_bytes, audio_format, max_duration_ms=keep_ms)]
+
+        return [
+            self.synthesizer.decode(audio_bytes, audio_format)
+            for audio_bytes, audio_format in encoded
+        ]
+
+    def _assemble(
+        self,
+        subtitles: Sequence[srt.Subtitle],
+        pending: Iterable[Future[List[AudioSegment]] | None],
+        track: _PcmTrack,
+    ) -> None:
+        """Lay out synthesized speech on the timeline in subtitle order."""
         cursor_ms = 0
 
         # Add leading silence if configured
         if self.pad_leading_ms > 0:
-            final_audio += AudioSegment.silent(duration=self.pad_leading_ms)
+            track.append_silence(self.pad_leading_ms)
             cursor_ms += self.pad_leading_ms
 
-        for subtitle in subtitles:
+        for subtitle, future in zip(subtitles, pending):
             start = timedelta_to_ms(subtitle.start)
             end = timedelta_to_ms(subtitle.end)
             slot_length = max(0, end - start)
 
             # Add silence to reach the start of this subtitle
             if start > cursor_ms:
-                final_audio += AudioSegment.silent(duration=start - cursor_ms)
+                track.append_silence(start - cursor_ms)
                 cursor_ms = start
 
-            raw_text = (subtitle.content or "").strip().replace("\n", " ")
-            if not raw_text:
+            if future is None:
                 # No text: just pad to end if filling
                 if self.fill_to_end and cursor_ms < end:
-                    final_audio += AudioSegment.silent(duration=end - cursor_ms)
+                    track.append_silence(end - cursor_ms)
                     cursor_ms = end
                 continue
 
             # Synthesize speech in chunks
-            speech_segments = AudioSegment.silent(duration=0)
-            for chunk in chunk_text(raw_text, max_chars=self.max_chars_per_call):
-                chunk_audio = self.synthesizer.synthesize(chunk)
-                speech_segments += chunk_audio
+            speech_segments = track.conform(future.result())
 
             speech_length = len(speech_segments)
 
@@ -79,29 +287,27 @@ class AudioPipeline:
                 speed_factor = speech_length / desired_ms if desired_ms else 1.0
                 speed_factor = min(speed_factor, self.max_speedup)
                 if speed_factor > 1.0 and not math.isclose(speed_factor, 1.0, rel_tol=1e-2):
-                    speech_segments = change_playback_speed(speech_segments, speed_factor)
+                    speech_segments = track.change_speed(speech_segments, speed_factor)
                     speech_length = len(speech_segments)
 
             if self.fill_to_end:
                 # Hard cut if enabled and still too long
-                if speech_length > slot_length and self.hard_cut:
-                    speech_segments = speech_segments[:slot_length]
-                    speech_length = len(speech_segments)
+                max_ms = slot_length if self.hard_cut else None
 
                 # Add speech and pad to end of slot
-                final_audio += speech_segments
-                cursor_ms += speech_length
+                cursor_ms += track.append_speech(speech_segments, max_ms=max_ms)
 
                 if cursor_ms < end:
-                    final_audio += AudioSegment.silent(duration=end - cursor_ms)
+                    track.append_silence(end - cursor_ms)
                     cursor_ms = end
             else:
                 # Natural flow: just add speech
-                final_audio += speech_segments
-                cursor_ms += speech_length
+                cursor_ms += track.append_speech(speech_segments)
 
         # Add trailing silence
         if self.pad_trailing_ms > 0:
-            final_audio += AudioSegment.silent(duration=self.pad_trailing_ms)
+            track.append_silence(self.pad_trailing_ms)
+
 
-        return final_audio
+def _subtitle_text(subtitle: srt.Subtitle) -> str:
+    return (subtitle.content or "").strip().replace("\n", " ")
@@ -25,6 +25,8 @@ DEFAULT_ELEVENLABS_FORMAT = "mp3_44100_128"
 DEFAULT_GOOGLE_VOICE_NAME = "en-US-Neural2-A"
 DEFAULT_GOOGLE_ENCODING = "MP3"
 
+_TRUE_VALUES = frozenset(("1", "true", "yes", "on"))
+
 
 def _env_or_default(name: str, default):
     """Get environment variable value or return default if not set."""
@@ -37,7 +39,7 @@ def _env_bool(name: str, default: bool) -> bool:
     raw = os.getenv(name)
     if raw is None:
         return default
-    return raw.strip().lower() in {"1", "true", "yes", "on"}
+    return raw.strip().lower() in _TRUE_VALUES
 
 
 def _env_int(name: str, default: int) -> int:
@@ -78,7 +80,11 @@ class AppConfig:
     pad_trailing_ms: int
     max_chars_per_call: int
     max_speedup: float
+    concurrency: int
+    batch_size: int
+    async_prefetch: bool
     transliterate: bool
+    dump_transliterated: bool
     srt_path: Path
 
     @classmethod
@@ -131,7 +137,21 @@ class AppConfig:
             args.max_speedup if args.max_speedup is not None else _env_float("TTS_MAX_SPEEDUP", 1.15)
         )
 
+        concurrency = (
+            args.concurrency if args.concurrency is not None else _env_int("TTS_CONCURRENCY", 4)
+        )
+
+        batch_size = (
+            args.batch_size if args.batch_size is not None else _env_int("TTS_BATCH_SIZE", 1)
+        )
+
+        if getattr(args, "async_prefetch", False):
+            async_prefetch = True
+        else:
+            async_prefetch = _env_bool("TTS_ASYNC_PREFETCH", False)
+
         transliterate = _env_bool("TTS_TRANSLITERATE", True)
+        dump_transliterated = _env_bool("TTS_DUMP_TRANSLITERATED", False)
 
         provider_config = _build_provider_config(
             provider=provider,
@@ -159,7 +179,11 @@ class AppConfig:
             pad_trailing_ms=pad_trailing_ms,
             max_chars_per_call=max_chars_per_call,
             max_speedup=max_speedup,
+            concurrency=concurrency,
+            batch_size=batch_size,
+            async_prefetch=async_prefetch,
             transliterate=transliterate,
+            dump_transliterated=dump_transliterated,
         )
 
 
@@ -281,4 +305,4 @@ def _env_bool_optional(name: str) -> bool | None:
     raw = os.getenv(name)
     if raw is None or not raw.strip():
         return None
-    return raw.strip().lower() in {"1", "true", "yes", "on"}
+    return raw.strip().lower() in _TRUE_VALUES
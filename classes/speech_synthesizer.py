@@ -2,16 +2,25 @@
 
 from __future__ import annotations
 
-import hashlib
+import asyncio
 import io
 import math
 from pathlib import Path
+from typing import Iterable, List, Sequence, Tuple
 
 from pydub import AudioSegment
-from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
+from tenacity import (
+    AsyncRetrying,
+    Retrying,
+    retry_if_exception,
+    stop_after_attempt,
+    stop_after_delay,
+    wait_exponential_jitter,
+)
 
-from .tts_providers import TTSProvider
-from .utils import change_playback_speed, ensure_directory
+from .tts_providers import CachingTTSProvider, TTSProvider
+from .tts_providers.caching_provider import DEFAULT_MEMORY_CACHE_BYTES
+from .utils import change_playback_speed
 
 
 class SpeechSynthesizer:
@@ -21,16 +30,27 @@ class SpeechSynthesizer:
         self,
         provider: TTSProvider,
         cache_dir: Path,
+        memory_cache_bytes: int = DEFAULT_MEMORY_CACHE_BYTES,
     ) -> None:
-        self._provider = provider
-        self.output_format = provider.output_format.lower()
+        self._cache = CachingTTSProvider(provider, cache_dir, memory_cache_bytes)
+        # Shared by the blocking and asyncio request paths. Only errors the provider
+        # reports as transient are retried; jitter keeps parallel workers from
+        # retrying a rate limit in lockstep.
+        self._retry_policy = dict(
+            stop=stop_after_attempt(4) | stop_after_delay(30),
+            wait=wait_exponential_jitter(initial=1, max=10),
+            retry=retry_if_exception(provider.is_retryable),
+        )
         self.cache_dir = cache_dir
-        ensure_directory(self.cache_dir)
+
+    @property
+    def output_format(self) -> str:
+        return self._cache.output_format
 
     def synthesize(self, text: str, speed: float = 1.0) -> AudioSegment:
         """Synthesize speech for the given text and adjust playback speed."""
-        base_audio_bytes = self._load_or_generate_bytes(text)
-        segment = AudioSegment.from_file(io.BytesIO(base_audio_bytes), format=self.output_format)
+        audio_bytes, audio_format = self.synthesize_bytes(text)
+        segment = self.decode(audio_bytes, audio_format)
 
         if speed <= 0:
             raise ValueError("Playback speed must be greater than zero.")
@@ -40,39 +60,64 @@ class SpeechSynthesizer:
 
         return segment
 
-    def _load_or_generate_bytes(self, text: str) -> bytes:
-        """Load cached audio bytes or generate fresh ones via API."""
-        cache_key = self._make_cache_key(text)
-        cache_file = self.cache_dir / f"{cache_key}.{self.output_format}"
-
-        if cache_file.exists():
-            return cache_file.read_bytes()
-
-        audio_bytes = self._request_speech(text)
-
-        # The provider may adjust the effective output format; recompute destination if needed.
-        cache_file = self.cache_dir / f"{cache_key}.{self.output_format}"
-        cache_file.write_bytes(audio_bytes)
-        return audio_bytes
+    def synthesize_bytes(self, text: str) -> Tuple[bytes, str]:
+        """Return the encoded audio for the given text and its format, without decoding it."""
+        audio_bytes = self._cache.lookup(text)
+        if audio_bytes is None:
+            audio_bytes = self._request_speech(text)
+        return audio_bytes, self.output_format
+
+    def synthesize_cached(self, text: str) -> str:
+        """Make sure the audio for the given text is on disk and return its cache path.
+
+        Used to warm the cache ahead of assembly; nothing is decoded.
+        """
+        # Stream straight to disk so warming never holds a whole chunk in memory.
+        return Retrying(**self._retry_policy)(self._cache.stream_to_cache, text)
+
+    def synthesize_many(self, texts: Sequence[str]) -> List[bytes]:
+        """Return the encoded audio for several texts, requesting the uncached ones together.
+
+        With a batching provider, consecutive short texts share a single request.
+        """
+        results = Retrying(**self._retry_policy)(self._cache.synthesize_many, texts)
+        return [result.audio_bytes for result in results]
+
+    @staticmethod
+    def decode(
+        audio_bytes: bytes, audio_format: str, max_duration_ms: int | None = None
+    ) -> AudioSegment:
+        """Decode provider audio bytes into PCM, optionally only the first ``max_duration_ms``."""
+        duration = max_duration_ms / 1000 if max_duration_ms is not None else None
+        return AudioSegment.from_file(io.BytesIO(audio_bytes), format=audio_format, duration=duration)
+
+    async def prefetch_async(self, texts: Iterable[str], concurrency: int) -> None:
+        """Synthesize every uncached text concurrently on one event loop and store it on disk.
+
+        Used before assembly so the pipeline only reads from the cache afterwards.
+        Async clients the provider opened on this loop are closed before returning.
+        """
+        limiter = asyncio.Semaphore(max(1, concurrency))
+
+        async def fetch(text: str) -> None:
+            if self._cache.contains(text):
+                return
+            async with limiter:
+                await self._request_speech_async(text)
+
+        try:
+            await asyncio.gather(*(fetch(text) for text in dict.fromkeys(texts)))
+        finally:
+            await self._cache.aclose()
 
-    def _make_cache_key(self, text: str) -> str:
-        """Generate a unique hash key for caching based on synthesis parameters."""
-        provider_parts = "|".join(self._provider.cache_fingerprint)
-        fingerprint = f"{provider_parts}|{self.output_format}|{text}".encode("utf-8")
-        return hashlib.sha1(fingerprint).hexdigest()
-
-    @retry(
-        stop=stop_after_attempt(4),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
-        retry=retry_if_exception_type(Exception),
-    )
     def _request_speech(self, text: str) -> bytes:
-        """Delegate synthesis to the configured provider."""
-        result = self._provider.synthesize(text)
-
-        if result.file_extension:
-            new_format = result.file_extension.lower()
-            if new_format != self.output_format:
-                self.output_format = new_format
+        """Synthesize through the cache layer, retrying transient provider errors."""
+        result = Retrying(**self._retry_policy)(self._cache.synthesize, text)
+        return result.audio_bytes
 
+    async def _request_speech_async(self, text: str) -> bytes:
+        """Asyncio variant of `_request_speech` with the same retry policy."""
+        async for attempt in AsyncRetrying(**self._retry_policy):
+            with attempt:
+                result = await self._cache.synthesize_async(text)
         return result.audio_bytes
@@ -1,76 +1,100 @@
 from __future__ import annotations
 
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List
+from typing import List, Sequence
 
 import srt
-from cyrtranslit import to_cyrillic
 
 """Subtitle loading utilities."""
 
+_RECORD_SEPARATOR = "\x1e"
+# U+0400-U+04FF in UTF-8: a lead byte in 0xD0-0xD3 followed by a continuation byte.
+_CYRILLIC_BYTES = re.compile(rb"[\xd0-\xd3][\x80-\xbf]")
+
+# Serbian Latin -> Cyrillic. Digraphs are replaced first so that e.g. "lj" becomes
+# "љ" rather than "лј"; every remaining letter maps one-to-one via str.translate.
+_DIGRAPHS = {
+    "Lj": "Љ", "lj": "љ", "LJ": "Љ",
+    "Nj": "Њ", "nj": "њ", "NJ": "Њ",
+    "Dž": "Џ", "dž": "џ", "DŽ": "Џ",
+}
+_DIGRAPH_PATTERN = re.compile("|".join(_DIGRAPHS))
+_LETTERS = str.maketrans(
+    "ABVGDĐEŽZIJKLMNOPRSTĆUFHCČŠabvgdđežzijklmnoprstćufhcčš",
+    "АБВГДЂЕЖЗИЈКЛМНОПРСТЋУФХЦЧШабвгдђежзијклмнопрстћуфхцчш",
+)
+
+
+def _to_cyrillic(text: str) -> str:
+    """Transliterate Serbian Latin text to Cyrillic."""
+    return _DIGRAPH_PATTERN.sub(lambda match: _DIGRAPHS[match.group()], text).translate(_LETTERS)
+
 
 class SubtitleService:
     """Handle subtitle loading and optional transliteration."""
 
-    def __init__(self, transliterate: bool = True, cache_dir: Path | None = None) -> None:
+    def __init__(
+        self,
+        transliterate: bool = True,
+        cache_dir: Path | None = None,
+        dump_transliterated: bool = False,
+    ) -> None:
         self.transliterate = transliterate
         self.cache_dir = cache_dir
+        self.dump_transliterated = dump_transliterated
 
     def load(self, source: Path) -> List[srt.Subtitle]:
-        """Load and optionally transliterate subtitles from the given SRT file path."""
-        # Determine the file to use
-        file_to_use = self._prepare_file(source)
-
-        with file_to_use.open("r", encoding="utf-8") as handle:
-            return list(srt.parse(handle.read()))
-
-    def _prepare_file(self, source: Path) -> Path:
-        """Prepare the SRT file, transliterating if needed."""
-        if not self.transliterate:
-            return source
-
-        # Check if already Cyrillic
-        if self._is_cyrillic(source):
-            return source
-
-        # Create transliterated copy in cache directory if available
+        """Load and optionally transliterate subtitles from the given SRT file path.
+
+        The file is read and parsed once; transliteration happens in memory.
+        """
+        data = source.read_bytes()
+        subtitles = list(srt.parse(data.decode("utf-8")))
+
+        if self.transliterate and not self._is_cyrillic(data):
+            self._transliterate(subtitles)
+            # Same ordering, numbering and blank-entry filtering as composing and reparsing.
+            subtitles = list(srt.sort_and_reindex(subtitles))
+            if self.dump_transliterated:
+                self._write_transliterated(source, subtitles)
+
+        return subtitles
+
+    def load_many(self, sources: Sequence[Path], max_workers: int = 8) -> List[List[srt.Subtitle]]:
+        """Load several SRT files concurrently, returning their subtitles in input order.
+
+        Meant for batch or server front-ends; file reads release the GIL, so they overlap.
+        """
+        if len(sources) <= 1:
+            return [self.load(source) for source in sources]
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(sources))) as executor:
+            return list(executor.map(self.load, sources))
+
+    def _transliterate(self, subtitles: List[srt.Subtitle]) -> None:
+        """Convert subtitle contents to Cyrillic Serbian with a single transliteration call."""
+        # The ASCII record separator never appears in subtitles and is left untouched.
+        joined = _RECORD_SEPARATOR.join(subtitle.content for subtitle in subtitles)
+        parts = _to_cyrillic(joined).split(_RECORD_SEPARATOR)
+        for subtitle, content in zip(subtitles, parts):
+            subtitle.content = content
+
+    def _is_cyrillic(self, data: bytes) -> bool:
+        """Check if the raw SRT bytes contain Cyrillic characters (no decoding needed)."""
+        return _CYRILLIC_BYTES.search(data) is not None
+
+    def _write_transliterated(self, source: Path, subtitles: List[srt.Subtitle]) -> None:
+        """Save a Cyrillic copy of the subtitles for inspection."""
         if self.cache_dir:
             self.cache_dir.mkdir(parents=True, exist_ok=True)
-            transliterated_path = self.cache_dir / "input-transliterated.srt"
+            target = self.cache_dir / "input-transliterated.srt"
         else:
-            transliterated_path = source.parent / "input-transliterated.srt"
-        
-        self._transliterate_file(source, transliterated_path)
-        return transliterated_path
-
-    def _is_cyrillic(self, file_path: Path) -> bool:
-        """Check if the SRT file contains Cyrillic characters."""
-        cyrillic_pattern = re.compile(r'[\u0400-\u04FF]')
-        with file_path.open("r", encoding="utf-8") as f:
-            content = f.read()
-            return bool(cyrillic_pattern.search(content))
-
-    def _transliterate_file(self, source: Path, target: Path) -> None:
-        """Transliterate the SRT file to Cyrillic Serbian."""
-        with source.open("r", encoding="utf-8") as src:
-            content = src.read()
-
-        # Parse SRT to preserve structure
-        subtitles = list(srt.parse(content))
-
-        # Transliterate each subtitle's content
-        transliterated_subtitles = []
-        for sub in subtitles:
-            transliterated_content = to_cyrillic(sub.content, "sr")
-            transliterated_sub = srt.Subtitle(
-                index=sub.index,
-                start=sub.start,
-                end=sub.end,
-                content=transliterated_content
-            )
-            transliterated_subtitles.append(transliterated_sub)
-
-        # Write back to target
-        with target.open("w", encoding="utf-8") as tgt:
-            tgt.write(srt.compose(transliterated_subtitles))
+            target = source.parent / "input-transliterated.srt"
+
+        # Write block by block (same output as srt.compose) through a 1 MiB buffer
+        # instead of building the whole file as one string first.
+        with target.open("w", encoding="utf-8", buffering=1 << 20) as tgt:
+            for subtitle in srt.sort_and_reindex(subtitles):
+                tgt.write(subtitle.to_srt())
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from .config import AppConfig
 from .tts_providers import (
+    BatchingProvider,
     ElevenLabsProviderConfig,
     GoogleProviderConfig,
     OpenAIProviderConfig,
@@ -17,6 +18,17 @@ from .tts_providers.openai_provider import OpenAIProvider
 def create_tts_provider(config: AppConfig) -> TTSProvider:
     """Build a TTSProvider instance based on application configuration."""
 
+    provider = _create_base_provider(config)
+    if config.batch_size > 1:
+        provider = BatchingProvider(
+            provider,
+            max_batch=config.batch_size,
+            max_chars=config.max_chars_per_call,
+        )
+    return provider
+
+
+def _create_base_provider(config: AppConfig) -> TTSProvider:
     provider_config = config.provider_config
 
     if isinstance(provider_config, OpenAIProviderConfig):
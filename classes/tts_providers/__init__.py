@@ -7,8 +7,12 @@ from .base import (
     SynthesisResult,
     TTSProvider,
 )
+from .batching_provider import BatchingProvider
+from .caching_provider import CachingTTSProvider
 
 __all__ = [
+    "BatchingProvider",
+    "CachingTTSProvider",
     "GoogleProviderConfig",
     "OpenAIProviderConfig",
     "ElevenLabsProviderConfig",
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Iterable, Tuple
+from typing import Iterable, Iterator, List, Sequence, Tuple
 
 
 @dataclass(frozen=True)
@@ -17,27 +18,56 @@ class SynthesisResult:
 
 
 class TTSProvider(ABC):
-    """Strategy interface for text-to-speech providers."""
+    """Strategy interface for text-to-speech providers.
 
-    @property
-    @abstractmethod
-    def name(self) -> str:
-        """Unique provider identifier (e.g., `openai`)."""
+    Implementations set the attributes below in ``__init__`` and declare them in
+    ``__slots__``; they are read for every synthesized chunk.
+    """
 
-    @property
-    @abstractmethod
-    def output_format(self) -> str:
-        """Audio file extension produced by this provider (e.g., `mp3`)."""
+    __slots__ = ()
 
-    @property
-    @abstractmethod
-    def cache_fingerprint(self) -> Tuple[str, ...]:
-        """Immutable tuple describing cache-relevant configuration parameters."""
+    name: str
+    """Unique provider identifier (e.g., `openai`)."""
+    output_format: str
+    """Audio file extension produced by this provider (e.g., `mp3`)."""
+    cache_fingerprint: Tuple[str, ...]
+    """Immutable tuple describing cache-relevant configuration parameters.
+
+    Built once in ``__init__`` from the frozen provider config, so it never changes;
+    the caching layer folds it into a byte prefix once more, so nothing here runs
+    per chunk. Its string values are part of every
+    on-disk cache key: changing how they are rendered orphans existing caches.
+    """
 
     @abstractmethod
     def synthesize(self, text: str) -> SynthesisResult:
         """Generate spoken audio for the supplied text."""
 
+    async def synthesize_async(self, text: str) -> SynthesisResult:
+        """Asyncio variant of `synthesize`; runs the blocking call in a worker thread by default."""
+        return await asyncio.to_thread(self.synthesize, text)
+
+    def synthesize_many(self, texts: Sequence[str]) -> List[SynthesisResult]:
+        """Generate audio for several texts, one result per text; one request each by default."""
+        return [self.synthesize(text) for text in texts]
+
+    def synthesize_stream(self, text: str) -> Iterator[bytes]:
+        """Yield the encoded audio in chunks as it arrives; yields one blob by default."""
+        yield self.synthesize(text).audio_bytes
+
+    def synthesize_to_path(self, text: str, path: str) -> None:
+        """Write the encoded audio for the text to ``path`` without holding it all in memory."""
+        with open(path, "wb") as handle:
+            for chunk in self.synthesize_stream(text):
+                handle.write(chunk)
+
+    async def aclose(self) -> None:
+        """Release async resources bound to the running event loop; nothing to release by default."""
+
+    def is_retryable(self, exc: BaseException) -> bool:
+        """Whether a failed `synthesize` call is transient (network, rate limit, 5xx) and worth retrying."""
+        return isinstance(exc, (ConnectionError, TimeoutError))
+
 
 @dataclass(frozen=True)
 class OpenAIProviderConfig:
@@ -66,15 +96,14 @@ class ElevenLabsProviderConfig:
     style: float | None = None
     use_speaker_boost: bool | None = None
 
+    def __post_init__(self) -> None:
+        # Derived once; object.__setattr__ bypasses the frozen guard and the
+        # attribute is not a field, so equality and hashing are unchanged.
+        object.__setattr__(self, "_file_extension", _elevenlabs_extension(self.output_format))
+
     @property
     def file_extension(self) -> str:
-        if self.output_format.startswith("mp3"):
-            return "mp3"
-        if self.output_format.startswith("ogg"):
-            return "ogg"
-        if self.output_format.startswith("wav"):
-            return "wav"
-        return "mp3"
+        return self._file_extension
 
 
 @dataclass(frozen=True)
@@ -90,15 +119,34 @@ class GoogleProviderConfig:
     effects_profile_ids: Tuple[str, ...] = ()
     language_code: str | None = None
 
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_output_format", _google_extension(self.audio_encoding))
+
     @property
     def output_format(self) -> str:
-        encoding = self.audio_encoding.upper()
-        if encoding == "MP3":
-            return "mp3"
-        if encoding == "OGG_OPUS":
-            return "ogg"
-        if encoding in {"LINEAR16", "MULAW", "ALAW"}:
-            return "wav"
+        return self._output_format
+
+
+def _elevenlabs_extension(output_format: str) -> str:
+    """Map an ElevenLabs output format such as ``mp3_44100_128`` to a file extension."""
+    if output_format.startswith("mp3"):
+        return "mp3"
+    if output_format.startswith("ogg"):
+        return "ogg"
+    if output_format.startswith("wav"):
+        return "wav"
+    return "mp3"
+
+
+def _google_extension(audio_encoding: str) -> str:
+    """Map a Google audio encoding name to a file extension."""
+    encoding = audio_encoding.upper()
+    if encoding == "MP3":
         return "mp3"
+    if encoding == "OGG_OPUS":
+        return "ogg"
+    if encoding in {"LINEAR16", "MULAW", "ALAW"}:
+        return "wav"
+    return "mp3"
 
 
@@ -0,0 +1,125 @@
+"""Opt-in wrapper that synthesizes several short texts in one provider request."""
+
+from __future__ import annotations
+
+import io
+from typing import Iterator, List, Sequence
+
+from pydub import AudioSegment
+from pydub.silence import detect_nonsilent
+
+from .base import SynthesisResult, TTSProvider
+
+# Texts longer than this are always requested on their own.
+SHORT_TEXT_CHARS = 200
+# A paragraph break makes every provider pause between the joined texts.
+_SEPARATOR = "\n\n"
+# Pauses at least this long mark the boundary between two joined texts.
+_MIN_GAP_MS = 400
+# Anything this far below the batch's average loudness counts as silence.
+_SILENCE_BELOW_AVERAGE_DB = 16
+
+
+class BatchingProvider(TTSProvider):
+    """Join consecutive short texts into one request and split the audio on the pauses between them.
+
+    Only `synthesize_many` batches; every other call goes straight to the wrapped
+    provider. When the number of detected speech regions does not match the number
+    of texts in a batch, that batch is requested one text at a time instead.
+
+    Split audio is trimmed and re-encoded, so the batch size is part of the cache
+    fingerprint: batched results never share cache entries with unbatched ones.
+    """
+
+    __slots__ = (
+        "_provider",
+        "_max_batch",
+        "_max_chars",
+        "name",
+        "output_format",
+        "cache_fingerprint",
+    )
+
+    def __init__(self, provider: TTSProvider, max_batch: int, max_chars: int) -> None:
+        self._provider = provider
+        self._max_batch = max(1, max_batch)
+        self._max_chars = max_chars
+        self.name = provider.name
+        self.output_format = provider.output_format
+        self.cache_fingerprint = (*provider.cache_fingerprint, f"batch:{self._max_batch}")
+
+    def synthesize(self, text: str) -> SynthesisResult:
+        return self._provider.synthesize(text)
+
+    async def synthesize_async(self, text: str) -> SynthesisResult:
+        return await self._provider.synthesize_async(text)
+
+    def synthesize_stream(self, text: str) -> Iterator[bytes]:
+        return self._provider.synthesize_stream(text)
+
+    def synthesize_to_path(self, text: str, path: str) -> None:
+        self._provider.synthesize_to_path(text, path)
+
+    async def aclose(self) -> None:
+        await self._provider.aclose()
+
+    def is_retryable(self, exc: BaseException) -> bool:
+        return self._provider.is_retryable(exc)
+
+    def synthesize_many(self, texts: Sequence[str]) -> List[SynthesisResult]:
+        results: List[SynthesisResult] = []
+        for batch in self._batches(texts):
+            if len(batch) == 1:
+                results.append(self._provider.synthesize(batch[0]))
+            else:
+                results.extend(self._synthesize_batch(batch))
+        return results
+
+    def _batches(self, texts: Sequence[str]) -> Iterator[List[str]]:
+        """Group consecutive short texts, respecting the batch size and character budget."""
+        batch: List[str] = []
+        size = 0
+        for text in texts:
+            if len(text) > SHORT_TEXT_CHARS:
+                if batch:
+                    yield batch
+                    batch, size = [], 0
+                yield [text]
+                continue
+
+            joined_size = size + len(_SEPARATOR) + len(text) if batch else len(text)
+            if batch and (len(batch) >= self._max_batch or joined_size > self._max_chars):
+                yield batch
+                batch, joined_size = [], len(text)
+            batch.append(text)
+            size = joined_size
+
+        if batch:
+            yield batch
+
+    def _synthesize_batch(self, batch: List[str]) -> List[SynthesisResult]:
+        result = self._provider.synthesize(_SEPARATOR.join(batch))
+        audio_format = (result.file_extension or self.output_format).lower()
+        audio = AudioSegment.from_file(io.BytesIO(result.audio_bytes), format=audio_format)
+
+        speech_ranges = detect_nonsilent(
+            audio,
+            min_silence_len=_MIN_GAP_MS,
+            silence_thresh=audio.dBFS - _SILENCE_BELOW_AVERAGE_DB,
+        )
+        if len(speech_ranges) != len(batch):
+            return [self._provider.synthesize(text) for text in batch]
+
+        return [
+            SynthesisResult(
+                audio_bytes=_encode(audio[start:end], audio_format),
+                file_extension=audio_format,
+            )
+            for start, end in speech_ranges
+        ]
+
+
+def _encode(segment: AudioSegment, audio_format: str) -> bytes:
+    buffer = io.BytesIO()
+    segment.export(buffer, format=audio_format)
+    return buffer.getvalue()
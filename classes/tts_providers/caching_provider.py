@@ -0,0 +1,239 @@
+"""Content-addressed audio cache that wraps any TTS provider."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Dict, List, Sequence
+
+from .base import SynthesisResult, TTSProvider
+
+DEFAULT_MEMORY_CACHE_BYTES = 64 * 1024 * 1024
+
+
+class _MemoryCache:
+    """Thread-safe LRU of audio bytes bounded by total size rather than entry count."""
+
+    def __init__(self, max_bytes: int) -> None:
+        self._max_bytes = max_bytes
+        self._entries: OrderedDict[str, bytes] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> bytes | None:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: str, value: bytes) -> None:
+        if len(value) > self._max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= len(previous)
+            self._entries[key] = value
+            self._size += len(value)
+            while self._size > self._max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+
+
+class CachingTTSProvider(TTSProvider):
+    """Serve repeated texts from memory or disk and only call the wrapped provider on a miss.
+
+    Audio is stored as ``cache_dir/<key[:2]>/<key>.<ext>`` so no single directory
+    grows huge, and written through a temp file plus ``os.replace`` so concurrent
+    workers never read a partial chunk. Concurrent misses for the same text share
+    a single provider request.
+    """
+
+    __slots__ = (
+        "_provider",
+        "_fingerprint_prefix",
+        "_cache_dir",
+        "_memory_cache",
+        "_inflight",
+        "_inflight_lock",
+        "name",
+        "output_format",
+        "cache_fingerprint",
+    )
+
+    def __init__(
+        self,
+        provider: TTSProvider,
+        cache_dir: Path,
+        memory_cache_bytes: int = DEFAULT_MEMORY_CACHE_BYTES,
+    ) -> None:
+        self._provider = provider
+        self.name = provider.name
+        self.output_format = provider.output_format.lower()
+        self.cache_fingerprint = provider.cache_fingerprint
+        self._fingerprint_prefix = self._build_fingerprint_prefix()
+        # Plain string paths keep Path object construction off the per-chunk hot path.
+        self._cache_dir = os.fspath(cache_dir)
+        self._memory_cache = _MemoryCache(memory_cache_bytes)
+        self._inflight: dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
+        os.makedirs(self._cache_dir, exist_ok=True)
+
+    async def aclose(self) -> None:
+        await self._provider.aclose()
+
+    def is_retryable(self, exc: BaseException) -> bool:
+        return self._provider.is_retryable(exc)
+
+    def synthesize(self, text: str) -> SynthesisResult:
+        cache_key = self.cache_key(text)
+        audio_bytes = self._lookup(cache_key)
+        if audio_bytes is None:
+            audio_bytes = self._synthesize_once(cache_key, text)
+        return SynthesisResult(audio_bytes=audio_bytes, file_extension=self.output_format)
+
+    async def synthesize_async(self, text: str) -> SynthesisResult:
+        audio_bytes = self.lookup(text)
+        if audio_bytes is None:
+            audio_bytes = self._store(text, await self._provider.synthesize_async(text))
+        return SynthesisResult(audio_bytes=audio_bytes, file_extension=self.output_format)
+
+    def synthesize_many(self, texts: Sequence[str]) -> List[SynthesisResult]:
+        cached: Dict[str, bytes] = {}
+        missing: List[str] = []
+        for text in dict.fromkeys(texts):
+            audio_bytes = self.lookup(text)
+            if audio_bytes is None:
+                missing.append(text)
+            else:
+                cached[text] = audio_bytes
+
+        if missing:
+            for text, result in zip(missing, self._provider.synthesize_many(missing)):
+                cached[text] = self._store(text, result)
+
+        return [
+            SynthesisResult(audio_bytes=cached[text], file_extension=self.output_format)
+            for text in texts
+        ]
+
+    def lookup(self, text: str) -> bytes | None:
+        """Return cached audio for the text (memory, then disk) or ``None`` on a miss."""
+        return self._lookup(self.cache_key(text))
+
+    def _lookup(self, cache_key: str) -> bytes | None:
+        audio_bytes = self._memory_cache.get(cache_key)
+        if audio_bytes is not None:
+            return audio_bytes
+
+        # Open directly instead of checking exists() first: one syscall per cache hit.
+        cache_path = self._cache_path(cache_key)
+        try:
+            with open(cache_path, "rb") as handle:
+                audio_bytes = handle.read()
+        except FileNotFoundError:
+            return None
+
+        self._memory_cache.put(cache_key, audio_bytes)
+        return audio_bytes
+
+    def contains(self, text: str) -> bool:
+        """Whether audio for the text is already on disk."""
+        return os.path.exists(self._cache_path(self.cache_key(text)))
+
+    def stream_to_cache(self, text: str) -> str:
+        """Have the provider write the audio straight into the cache and return the file path."""
+        cache_key = self.cache_key(text)
+        cache_path = self._cache_path(cache_key)
+        if self.contains(text):
+            return cache_path
+
+        tmp_path = self._temp_path(cache_path)
+        try:
+            self._provider.synthesize_to_path(text, tmp_path)
+            os.replace(tmp_path, cache_path)
+        except BaseException:
+            _discard(tmp_path)
+            raise
+        return cache_path
+
+    def cache_key(self, text: str) -> str:
+        """Generate a unique hash key for caching based on synthesis parameters."""
+        fingerprint = self._fingerprint_prefix + text.encode("utf-8")
+        return hashlib.blake2b(fingerprint, digest_size=16).hexdigest()
+
+    def _cache_path(self, cache_key: str) -> str:
+        return f"{self._cache_dir}/{cache_key[:2]}/{cache_key}.{self.output_format}"
+
+    def _temp_path(self, cache_path: str) -> str:
+        """Per-thread temp file beside ``cache_path``, creating the shard directory on first use."""
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        return f"{cache_path}.{threading.get_ident()}.part"
+
+    def _synthesize_once(self, cache_key: str, text: str) -> bytes:
+        """Call the provider for a miss, letting concurrent callers for the same key wait on it."""
+        with self._inflight_lock:
+            future = self._inflight.get(cache_key)
+            is_owner = future is None
+            if is_owner:
+                future = self._inflight[cache_key] = Future()
+        if not is_owner:
+            return future.result()
+
+        try:
+            # A previous owner may have stored the audio after our first lookup.
+            audio_bytes = self._lookup(cache_key)
+            if audio_bytes is None:
+                audio_bytes = self._store(text, self._provider.synthesize(text))
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(audio_bytes)
+            return audio_bytes
+        finally:
+            with self._inflight_lock:
+                del self._inflight[cache_key]
+
+    def _store(self, text: str, result: SynthesisResult) -> bytes:
+        """Persist freshly synthesized audio to the disk and memory caches."""
+        self._accept_format(result.file_extension)
+        # The key depends on the output format, so compute it after any format change.
+        cache_key = self.cache_key(text)
+        cache_path = self._cache_path(cache_key)
+        tmp_path = self._temp_path(cache_path)
+        try:
+            with open(tmp_path, "wb") as handle:
+                handle.write(result.audio_bytes)
+            os.replace(tmp_path, cache_path)
+        except BaseException:
+            _discard(tmp_path)
+            raise
+        self._memory_cache.put(cache_key, result.audio_bytes)
+        return result.audio_bytes
+
+    def _accept_format(self, file_extension: str | None) -> None:
+        """Track format changes reported by the provider."""
+        if file_extension:
+            new_format = file_extension.lower()
+            if new_format != self.output_format:
+                self.output_format = new_format
+                self._fingerprint_prefix = self._build_fingerprint_prefix()
+
+    def _build_fingerprint_prefix(self) -> bytes:
+        """Encode the per-provider part of the cache key once instead of per chunk."""
+        provider_parts = "|".join(self.cache_fingerprint)
+        return f"{provider_parts}|{self.output_format}|".encode("utf-8")
+
+
+def _discard(tmp_path: str) -> None:
+    """Remove a temp file left by a failed write, if the failure left one."""
+    try:
+        os.unlink(tmp_path)
+    except FileNotFoundError:
+        pass
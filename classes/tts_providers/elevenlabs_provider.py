@@ -3,10 +3,12 @@
 from __future__ import annotations
 
 import os
-from collections.abc import Iterable
-from typing import Dict, Tuple
+from functools import lru_cache
+from typing import Dict, Iterator
 
+import httpx
 from elevenlabs.client import ElevenLabs
+from elevenlabs.core.api_error import ApiError
 
 from .base import ElevenLabsProviderConfig, SynthesisResult, TTSProvider
 
@@ -14,33 +16,38 @@ from .base import ElevenLabsProviderConfig, SynthesisResult, TTSProvider
 class ElevenLabsProvider(TTSProvider):
     """Adapter over the ElevenLabs Text-to-Speech API."""
 
+    __slots__ = ("_config", "_client", "name", "output_format", "cache_fingerprint")
+
     def __init__(self, config: ElevenLabsProviderConfig, client: ElevenLabs | None = None) -> None:
         self._config = config
+        self.name = "elevenlabs"
+        self.output_format = config.file_extension
         # Explicitly pass API key to the SDK (falls back to env var if not set)
-        self._client = client or ElevenLabs(api_key=os.getenv("ELEVENLABS_API_KEY"))
-
-    @property
-    def name(self) -> str:
-        return "elevenlabs"
-
-    @property
-    def output_format(self) -> str:
-        return self._config.file_extension
-
-    @property
-    def cache_fingerprint(self) -> Tuple[str, ...]:
-        return (
+        self._client = client or ElevenLabs(api_key=_api_key())
+        self.cache_fingerprint = (
             self.name,
-            self._config.voice_id,
-            self._config.model_id,
-            self._config.output_format,
-            str(self._config.stability or ""),
-            str(self._config.similarity_boost or ""),
-            str(self._config.style or ""),
-            str(self._config.use_speaker_boost or ""),
+            config.voice_id,
+            config.model_id,
+            config.output_format,
+            str(config.stability or ""),
+            str(config.similarity_boost or ""),
+            str(config.style or ""),
+            str(config.use_speaker_boost or ""),
         )
 
     def synthesize(self, text: str) -> SynthesisResult:
+        audio_bytes = _drain_bytes_iter(self._open_stream(text))
+
+        return SynthesisResult(
+            audio_bytes=audio_bytes,
+            file_extension=self.output_format,
+        )
+
+    def synthesize_stream(self, text: str) -> Iterator[bytes]:
+        yield from self._open_stream(text)
+
+    def _open_stream(self, text: str) -> Iterator[bytes]:
+        """Call the streaming endpoint so audio arrives while it is still being generated."""
         voice_settings = _build_voice_settings(self._config)
 
         request_kwargs = {
@@ -53,13 +60,28 @@ class ElevenLabsProvider(TTSProvider):
         if voice_settings:
             request_kwargs["voice_settings"] = voice_settings
 
-        audio = self._client.text_to_speech.convert(**request_kwargs)
-        audio_bytes = _coerce_to_bytes(audio)
+        text_to_speech = self._client.text_to_speech
+        # Newer SDKs name it `stream`; older ones only have `convert_as_stream`.
+        stream = getattr(text_to_speech, "stream", None) or text_to_speech.convert_as_stream
+        return stream(**request_kwargs)
 
-        return SynthesisResult(
-            audio_bytes=audio_bytes,
-            file_extension=self.output_format,
-        )
+    def is_retryable(self, exc: BaseException) -> bool:
+        if isinstance(exc, httpx.TransportError):
+            return True
+        if isinstance(exc, ApiError):
+            status = exc.status_code or 0
+            return status == 429 or status >= 500
+        return False
+
+
+@lru_cache(maxsize=None)
+def _api_key() -> str | None:
+    """Read the API key once, on first use.
+
+    Not a module-level constant: this module is imported before main.py loads `.env`.
+    Call ``_api_key.cache_clear()`` to pick up a changed environment.
+    """
+    return os.getenv("ELEVENLABS_API_KEY")
 
 
 def _build_voice_settings(config: ElevenLabsProviderConfig) -> Dict[str, float | bool]:
@@ -75,32 +97,11 @@ def _build_voice_settings(config: ElevenLabsProviderConfig) -> Dict[str, float |
     return voice_settings
 
 
-def _coerce_to_bytes(audio) -> bytes:
-    if isinstance(audio, bytes):
-        return audio
-    if isinstance(audio, bytearray):
-        return bytes(audio)
-    if hasattr(audio, "read") and callable(audio.read):
-        chunk = audio.read()
-        if isinstance(chunk, (bytes, bytearray)):
-            return bytes(chunk)
-        if isinstance(chunk, memoryview):
-            return chunk.tobytes()
-        raise TypeError("Unexpected ElevenLabs audio payload chunk type from file-like object")
-    if isinstance(audio, str):
-        raise TypeError("Unexpected ElevenLabs audio payload type")
-    if isinstance(audio, Iterable):
-        buffer = bytearray()
-        for chunk in audio:
-            if isinstance(chunk, bytes):
-                buffer.extend(chunk)
-            elif isinstance(chunk, bytearray):
-                buffer.extend(chunk)
-            elif isinstance(chunk, memoryview):
-                buffer.extend(chunk)
-            else:
-                raise TypeError("Unexpected ElevenLabs audio chunk type")
-        return bytes(buffer)
-    raise TypeError("Unexpected ElevenLabs audio payload type")
+def _drain_bytes_iter(audio: Iterator[bytes]) -> bytes:
+    """Join the chunks of the SDK's audio stream."""
+    buffer = bytearray()
+    for chunk in audio:
+        buffer += chunk
+    return bytes(buffer)
 
 
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
-from typing import Tuple
+from functools import lru_cache
 
 import google.cloud.texttospeech as tts
+from google.api_core import exceptions as google_exceptions
 
 from .base import GoogleProviderConfig, SynthesisResult, TTSProvider
 
@@ -12,62 +13,46 @@ from .base import GoogleProviderConfig, SynthesisResult, TTSProvider
 class GoogleTTSProvider(TTSProvider):
     """Adapter over the Google Cloud Text-to-Speech API."""
 
+    __slots__ = (
+        "_config",
+        "_client",
+        "_voice_params",
+        "_audio_config",
+        "name",
+        "output_format",
+        "cache_fingerprint",
+    )
+
     def __init__(self, config: GoogleProviderConfig, client: tts.TextToSpeechClient | None = None) -> None:
         self._config = config
+        self.name = "google"
+        self.output_format = config.output_format
         self._client = client or tts.TextToSpeechClient()
-
-    @property
-    def name(self) -> str:
-        return "google"
-
-    @property
-    def output_format(self) -> str:
-        return self._config.output_format
-
-    @property
-    def cache_fingerprint(self) -> Tuple[str, ...]:
-        return (
+        self.cache_fingerprint = (
             self.name,
-            self._config.voice_name,
-            self._config.audio_encoding.upper(),
-            str(self._config.speaking_rate or ""),
-            str(self._config.pitch or ""),
-            str(self._config.sample_rate_hertz or ""),
-            str(self._config.volume_gain_db or ""),
-            "|".join(self._config.effects_profile_ids),
-            self._config.language_code or "",
+            config.voice_name,
+            config.audio_encoding.upper(),
+            str(config.speaking_rate or ""),
+            str(config.pitch or ""),
+            str(config.sample_rate_hertz or ""),
+            str(config.volume_gain_db or ""),
+            "|".join(config.effects_profile_ids),
+            config.language_code or "",
         )
+        # Request parameters depend only on the frozen config; build the protobufs once.
+        self._voice_params = tts.VoiceSelectionParams(
+            language_code=config.language_code or _derive_language(config.voice_name),
+            name=config.voice_name,
+        )
+        self._audio_config = _build_audio_config(config)
 
     def synthesize(self, text: str) -> SynthesisResult:
-        language_code = self._config.language_code or _derive_language(self._config.voice_name)
-
         synthesis_input = tts.SynthesisInput(text=text)
-        voice_params = tts.VoiceSelectionParams(
-            language_code=language_code,
-            name=self._config.voice_name,
-        )
-
-        audio_config_kwargs = {
-            "audio_encoding": _resolve_audio_encoding(self._config.audio_encoding),
-        }
-
-        if self._config.speaking_rate is not None:
-            audio_config_kwargs["speaking_rate"] = self._config.speaking_rate
-        if self._config.pitch is not None:
-            audio_config_kwargs["pitch"] = self._config.pitch
-        if self._config.sample_rate_hertz is not None:
-            audio_config_kwargs["sample_rate_hertz"] = self._config.sample_rate_hertz
-        if self._config.volume_gain_db is not None:
-            audio_config_kwargs["volume_gain_db"] = self._config.volume_gain_db
-        if self._config.effects_profile_ids:
-            audio_config_kwargs["effects_profile_id"] = list(self._config.effects_profile_ids)
-
-        audio_config = tts.AudioConfig(**audio_config_kwargs)
 
         response = self._client.synthesize_speech(
             input=synthesis_input,
-            voice=voice_params,
-            audio_config=audio_config,
+            voice=self._voice_params,
+            audio_config=self._audio_config,
         )
 
         return SynthesisResult(
@@ -75,6 +60,17 @@ class GoogleTTSProvider(TTSProvider):
             file_extension=self.output_format,
         )
 
+    def is_retryable(self, exc: BaseException) -> bool:
+        return isinstance(
+            exc,
+            (
+                google_exceptions.ServiceUnavailable,
+                google_exceptions.TooManyRequests,
+                google_exceptions.InternalServerError,
+                google_exceptions.DeadlineExceeded,
+            ),
+        )
+
 
 def _derive_language(voice_name: str) -> str:
     parts = voice_name.split("-")
@@ -83,6 +79,26 @@ def _derive_language(voice_name: str) -> str:
     return "en-US"
 
 
+def _build_audio_config(config: GoogleProviderConfig) -> tts.AudioConfig:
+    audio_config_kwargs = {
+        "audio_encoding": _resolve_audio_encoding(config.audio_encoding),
+    }
+
+    if config.speaking_rate is not None:
+        audio_config_kwargs["speaking_rate"] = config.speaking_rate
+    if config.pitch is not None:
+        audio_config_kwargs["pitch"] = config.pitch
+    if config.sample_rate_hertz is not None:
+        audio_config_kwargs["sample_rate_hertz"] = config.sample_rate_hertz
+    if config.volume_gain_db is not None:
+        audio_config_kwargs["volume_gain_db"] = config.volume_gain_db
+    if config.effects_profile_ids:
+        audio_config_kwargs["effects_profile_id"] = list(config.effects_profile_ids)
+
+    return tts.AudioConfig(**audio_config_kwargs)
+
+
+@lru_cache(maxsize=None)
 def _resolve_audio_encoding(value: str) -> tts.AudioEncoding:
     normalized = value.upper()
     try:
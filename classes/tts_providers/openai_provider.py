@@ -2,56 +2,68 @@
 
 from __future__ import annotations
 
-from typing import Tuple
+import asyncio
+import threading
+from types import MappingProxyType
+from typing import Iterator
 
-from openai import OpenAI
+import httpx
+import openai
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient, OpenAI
 
 from .base import OpenAIProviderConfig, SynthesisResult, TTSProvider
 
+STREAM_CHUNK_BYTES = 64 * 1024
+
 
 class OpenAIProvider(TTSProvider):
     """Adapter over the OpenAI TTS API."""
 
+    __slots__ = (
+        "_config",
+        "_client",
+        "_async_clients",
+        "_async_lock",
+        "_input_prefix",
+        "_base_kwargs",
+        "name",
+        "output_format",
+        "cache_fingerprint",
+    )
+
     def __init__(self, config: OpenAIProviderConfig, client: OpenAI | None = None) -> None:
         self._config = config
+        self.name = "openai"
+        self.output_format = config.output_format.lower()
         self._client = client or OpenAI()
-
-    @property
-    def name(self) -> str:
-        return "openai"
-
-    @property
-    def output_format(self) -> str:
-        return self._config.output_format.lower()
-
-    @property
-    def cache_fingerprint(self) -> Tuple[str, ...]:
-        return (
+        # Async clients are bound to the event loop they were created on, and
+        # concurrent server jobs each run their own loop.
+        self._async_clients: dict[asyncio.AbstractEventLoop, AsyncOpenAI] = {}
+        self._async_lock = threading.Lock()
+        self.cache_fingerprint = (
             self.name,
-            self._config.model,
-            self._config.voice,
-            self._config.response_format,
-            self._config.instructions,
-            self._config.force_language or "",
+            config.model,
+            config.voice,
+            config.response_format,
+            config.instructions,
+            config.force_language or "",
         )
-
-    def synthesize(self, text: str) -> SynthesisResult:
-        payload_text = text
-        if self._config.force_language:
-            payload_text = f"[lang:{self._config.force_language}]  {payload_text}"
-
-        request_kwargs = {
-            "model": self._config.model,
-            "voice": self._config.voice,
-            "input": payload_text,
-            "response_format": self._config.response_format,
+        # Everything but the input text is fixed per provider; read-only since worker
+        # threads share it.
+        self._input_prefix = f"[lang:{config.force_language}]  " if config.force_language else ""
+        base_kwargs = {
+            "model": config.model,
+            "voice": config.voice,
+            "response_format": config.response_format,
         }
+        if config.instructions:
+            base_kwargs["instructions"] = config.instructions
+        self._base_kwargs = MappingProxyType(base_kwargs)
 
-        if self._config.instructions:
-            request_kwargs["instructions"] = self._config.instructions
-
-        response = self._client.audio.speech.create(**request_kwargs)
-        audio_bytes = _materialize_audio_bytes(response)
+    def synthesize(self, text: str) -> SynthesisResult:
+        speech = self._client.audio.speech.with_streaming_response
+        with speech.create(**self._request_kwargs(text)) as response:
+            audio_bytes = response.read()
 
         return SynthesisResult(
             audio_bytes=audio_bytes,
@@ -59,18 +71,62 @@ class OpenAIProvider(TTSProvider):
             mime_type=None,
         )
 
+    async def synthesize_async(self, text: str) -> SynthesisResult:
+        speech = self._get_async_client().audio.speech.with_streaming_response
+        async with speech.create(**self._request_kwargs(text)) as response:
+            audio_bytes = await response.read()
 
-def _materialize_audio_bytes(response) -> bytes:
-    if hasattr(response, "read") and callable(response.read):
-        return response.read()
-    if hasattr(response, "to_bytes") and callable(response.to_bytes):
-        return response.to_bytes()
-    if hasattr(response, "getvalue") and callable(response.getvalue):
-        return response.getvalue()
-    if hasattr(response, "content"):
-        content = response.content
-        if isinstance(content, bytes):
-            return content
-    raise TypeError("Unexpected response type returned by OpenAI audio.speech.create")
+        return SynthesisResult(
+            audio_bytes=audio_bytes,
+            file_extension=self.output_format,
+            mime_type=None,
+        )
 
+    def synthesize_stream(self, text: str) -> Iterator[bytes]:
+        speech = self._client.audio.speech.with_streaming_response
+        with speech.create(**self._request_kwargs(text)) as response:
+            yield from response.iter_bytes(STREAM_CHUNK_BYTES)
+
+    def synthesize_to_path(self, text: str, path: str) -> None:
+        speech = self._client.audio.speech.with_streaming_response
+        with speech.create(**self._request_kwargs(text)) as response:
+            response.stream_to_file(path, chunk_size=STREAM_CHUNK_BYTES)
+
+    async def aclose(self) -> None:
+        loop = asyncio.get_running_loop()
+        with self._async_lock:
+            client = self._async_clients.pop(loop, None)
+        if client is not None:
+            await client.close()
+
+    def is_retryable(self, exc: BaseException) -> bool:
+        # APIConnectionError also covers APITimeoutError.
+        return isinstance(
+            exc,
+            (openai.APIConnectionError, openai.RateLimitError, openai.InternalServerError),
+        )
 
+    def _request_kwargs(self, text: str) -> dict:
+        return self._base_kwargs | {"input": self._input_prefix + text}
+
+    def _get_async_client(self) -> AsyncOpenAI:
+        """Return the running loop's client, creating it on first use; `aclose` releases it."""
+        loop = asyncio.get_running_loop()
+        with self._async_lock:
+            client = self._async_clients.get(loop)
+            if client is None:
+                # One HTTP/2 connection pool multiplexes all in-flight speech requests.
+                http_client = DefaultAsyncHttpxClient(
+                    http2=True,
+                    limits=httpx.Limits(max_connections=64, max_keepalive_connections=64),
+                )
+                client = AsyncOpenAI(
+                    api_key=self._client.api_key,
+                    organization=self._client.organization,
+                    project=self._client.project,
+                    base_url=self._client.base_url,
+                    timeout=self._client.timeout,
+                    http_client=http_client,
+                )
+                self._async_clients[loop] = client
+        return client
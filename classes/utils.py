@@ -3,15 +3,13 @@
 from __future__ import annotations
 
 import math
-from pathlib import Path
 from typing import Iterable, List
 
+import numpy as np
 from pydub import AudioSegment
 
-
-def ensure_directory(path: Path) -> None:
-    """Create the directory if it does not already exist."""
-    path.mkdir(parents=True, exist_ok=True)
+# NumPy dtypes for the PCM sample widths pydub produces (8-bit WAV is unsigned).
+_PCM_DTYPES = {1: np.uint8, 2: np.int16, 4: np.int32}
 
 
 def timedelta_to_ms(td) -> int:
@@ -19,24 +17,26 @@ def timedelta_to_ms(td) -> int:
     return int(td.total_seconds() * 1000)
 
 
-def chunk_text(text: str, max_chars: int = 4000) -> List[str]:
-    """Split text into safe chunks to stay under the API character ceiling."""
-    text = text.strip()
+def chunk_text(text: str, max_chars: int = 4000, strip: bool = True) -> List[str]:
+    """Split text into safe chunks to stay under the API character ceiling.
+
+    Pass ``strip=False`` when the caller already trimmed the text.
+    """
+    if strip:
+        text = text.strip()
     if len(text) <= max_chars:
         return [text]
 
-    parts: List[str] = []
-    start = 0
-    end = len(text)
-    while start < end:
-        parts.append(text[start : start + max_chars])
-        start += max_chars
-    return parts
+    return [text[start : start + max_chars] for start in range(0, len(text), max_chars)]
 
 
 def clamp(value: float, min_value: float, max_value: float) -> float:
-    """Clamp a floating point value into the provided bounds."""
-    return max(min_value, min(value, max_value))
+    """Clamp a floating point value into the provided bounds.
+
+    Cold helper kept for API stability; nothing in the pipeline calls it. Use
+    ``numpy.clip`` when clamping many values at once.
+    """
+    return min_value if value < min_value else max_value if value > max_value else value
 
 
 def change_playback_speed(segment: AudioSegment, speed: float) -> AudioSegment:
@@ -47,7 +47,107 @@ def change_playback_speed(segment: AudioSegment, speed: float) -> AudioSegment:
     if math.isclose(speed, 1.0, rel_tol=1e-3):
         return segment
 
-    # Adjust frame rate to change speed, then reset to original rate for pitch preservation
-    new_frame_rate = int(segment.frame_rate * speed)
-    shifted = segment._spawn(segment.raw_data, overrides={"frame_rate": new_frame_rate})
-    return shifted.set_frame_rate(segment.frame_rate)
+    if segment.sample_width not in _PCM_DTYPES:
+        # 24-bit audio has no NumPy dtype: reinterpret at a scaled frame rate and let
+        # pydub resample back to the original rate.
+        new_frame_rate = int(segment.frame_rate * speed)
+        shifted = segment._spawn(segment.raw_data, overrides={"frame_rate": new_frame_rate})
+        return shifted.set_frame_rate(segment.frame_rate)
+
+    raw = resample_pcm(segment.raw_data, segment.sample_width, segment.channels, speed)
+    return segment._spawn(raw)
+
+
+def resample_pcm(raw: bytes, sample_width: int, channels: int, speed: float) -> bytes:
+    """Change the playback speed of interleaved raw PCM by linear resampling.
+
+    Shortens the audio by ``speed`` and shifts the pitch with it, as a single
+    vectorized NumPy pass over the samples.
+    """
+    if speed <= 0:
+        raise ValueError("Playback speed must be greater than zero.")
+
+    dtype = _PCM_DTYPES.get(sample_width)
+    if dtype is None:
+        raise ValueError(f"Unsupported PCM sample width: {sample_width} bytes.")
+
+    samples = np.frombuffer(raw, dtype=dtype).reshape(-1, channels)
+    frame_count = samples.shape[0]
+    output_count = int(frame_count / speed)
+    if frame_count == 0 or output_count == 0:
+        return b""
+
+    source_positions = np.arange(frame_count)
+    target_positions = np.arange(output_count) * speed
+    resampled = np.empty((output_count, channels), dtype=dtype)
+    for channel in range(channels):
+        interpolated = np.interp(target_positions, source_positions, samples[:, channel])
+        resampled[:, channel] = np.rint(interpolated)
+    return resampled.tobytes()
+
+
+# MPEG audio frame header tables, indexed by the header's bitrate/sample-rate fields.
+_MP3_BITRATES_KBPS = {
+    (1, 1): (0, 32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448),
+    (1, 2): (0, 32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384),
+    (1, 3): (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    (2, 1): (0, 32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256),
+    (2, 2): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+    (2, 3): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+_MP3_SAMPLE_RATES = {
+    3: (44100, 48000, 32000),  # MPEG-1
+    2: (22050, 24000, 16000),  # MPEG-2
+    0: (11025, 12000, 8000),  # MPEG-2.5
+}
+
+
+def mp3_duration_ms(data: bytes) -> int | None:
+    """Measure an MP3 stream by walking its frame headers, without decoding audio.
+
+    The result is an upper bound: a Xing/LAME info frame and the encoder delay
+    are counted as audio. Returns ``None`` when the data does not look like a
+    well-formed MP3 stream.
+    """
+    position = 0
+    size = len(data)
+
+    # Skip a leading ID3v2 tag (10-byte header, syncsafe size, optional footer).
+    if data[:3] == b"ID3" and size >= 10:
+        tag_size = (data[6] << 21) | (data[7] << 14) | (data[8] << 7) | data[9]
+        position = 10 + tag_size + (10 if data[5] & 0x10 else 0)
+
+    total_samples = 0
+    sample_rate = 0
+    while position + 4 <= size:
+        b1, b2 = data[position + 1], data[position + 2]
+        if data[position] != 0xFF or (b1 & 0xE0) != 0xE0:
+            if data[position : position + 3] == b"TAG":  # trailing ID3v1 tag
+                break
+            return None
+
+        version_bits = (b1 >> 3) & 0x03
+        layer = 4 - ((b1 >> 1) & 0x03)
+        bitrate_index = b2 >> 4
+        rate_index = (b2 >> 2) & 0x03
+        if version_bits == 1 or layer == 4 or rate_index == 3 or bitrate_index in (0, 15):
+            return None
+
+        version = 1 if version_bits == 3 else 2
+        bitrate = _MP3_BITRATES_KBPS[(version, layer)][bitrate_index] * 1000
+        sample_rate = _MP3_SAMPLE_RATES[version_bits][rate_index]
+        padding = (b2 >> 1) & 0x01
+
+        if layer == 1:
+            frame_samples = 384
+            frame_length = (12 * bitrate // sample_rate + padding) * 4
+        else:
+            frame_samples = 576 if (layer == 3 and version == 2) else 1152
+            frame_length = frame_samples // 8 * bitrate // sample_rate + padding
+
+        total_samples += frame_samples
+        position += frame_length
+
+    if not sample_rate:
+        return None
+    return total_samples * 1000 // sample_rate
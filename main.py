@@ -4,21 +4,29 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 from dotenv import load_dotenv
+from tqdm import tqdm
 
+from classes.audio_export import FfmpegWriter
 from classes.audio_pipeline import AudioPipeline
 from classes.config import AppConfig
 from classes.speech_synthesizer import SpeechSynthesizer
 from classes.subtitle_service import SubtitleService
 from classes.tts_factory import create_tts_provider
 
-# Ensure environment variables (OPENAI_API_KEY, etc.) are available early on.
 PROJECT_ROOT = Path(__file__).resolve().parent
-load_dotenv(PROJECT_ROOT / ".env")
+
+
+@functools.lru_cache(maxsize=None)
+def load_environment() -> None:
+    """Load `.env` into the environment once per process; real environment variables win."""
+    load_dotenv(PROJECT_ROOT / ".env", override=False)
 
 
 def create_argument_parser() -> argparse.ArgumentParser:
@@ -103,6 +111,23 @@ def create_argument_parser() -> argparse.ArgumentParser:
         default=None,
         help="Maximum playback speed multiplier applied when speech overruns its slot.",
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=None,
+        help="Number of TTS requests allowed in flight at the same time.",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=None,
+        help="Join up to this many consecutive short subtitles into one TTS request (1 disables).",
+    )
+    parser.add_argument(
+        "--async-prefetch",
+        action="store_true",
+        help="Fetch all uncached chunks on an asyncio event loop before assembling audio.",
+    )
     parser.add_argument(
         "--instructions",
         default=None,
@@ -117,6 +142,8 @@ def create_argument_parser() -> argparse.ArgumentParser:
 
 
 def run_cli(argv: list[str] | None = None) -> int:
+    # Ensure environment variables (OPENAI_API_KEY, etc.) are available before config and providers.
+    load_environment()
     parser = create_argument_parser()
     args = parser.parse_args(argv)
 
@@ -130,7 +157,11 @@ def run_cli(argv: list[str] | None = None) -> int:
         print(f"You can also set TTS_SRT_PATH environment variable to specify a different default location.", file=sys.stderr)
         return 1
     
-    subtitle_service = SubtitleService(transliterate=config.transliterate, cache_dir=config.cache_dir)
+    subtitle_service = SubtitleService(
+        transliterate=config.transliterate,
+        cache_dir=config.cache_dir,
+        dump_transliterated=config.dump_transliterated,
+    )
 
     subtitles = subtitle_service.load(subtitle_path)
 
@@ -140,7 +171,28 @@ def run_cli(argv: list[str] | None = None) -> int:
         cache_dir=config.cache_dir,
     )
 
-    pipeline = AudioPipeline(
+    pipeline = build_pipeline(config, synthesizer)
+
+    # The asyncio prefetch inside the pipeline already covers this step.
+    if not config.async_prefetch:
+        prewarm_cache(
+            synthesizer,
+            pipeline.unique_chunks(subtitles),
+            config.concurrency,
+            batch_size=config.batch_size,
+        )
+
+    output_path = resolve_output_path(args, config)
+    output_format = output_path.suffix.lstrip(".") or synthesizer.output_format
+    # Encode while assembling instead of exporting the finished track afterwards.
+    pipeline.export(subtitles, FfmpegWriter(output_path, output_format))
+
+    print(f"Done: {output_path}")
+    return 0
+
+
+def build_pipeline(config: AppConfig, synthesizer: SpeechSynthesizer) -> AudioPipeline:
+    return AudioPipeline(
         synthesizer=synthesizer,
         fill_to_end=config.fill_to_end,
         hard_cut=config.hard_cut,
@@ -148,29 +200,63 @@ def run_cli(argv: list[str] | None = None) -> int:
         pad_trailing_ms=config.pad_trailing_ms,
         max_chars_per_call=config.max_chars_per_call,
         max_speedup=config.max_speedup,
+        concurrency=config.concurrency,
+        async_prefetch=config.async_prefetch,
     )
 
-    final_audio = pipeline.build(subtitles)
 
-    # Determine output path with job-based naming
+def prewarm_cache(
+    synthesizer: SpeechSynthesizer,
+    chunks: list[str],
+    concurrency: int,
+    show_progress: bool = True,
+    batch_size: int = 1,
+) -> None:
+    """Synthesize every uncached chunk in parallel so the pipeline only stitches cached audio.
+
+    With ``batch_size > 1`` consecutive chunks are submitted in groups, which a
+    batching provider can merge into fewer requests.
+    """
+    executor = ThreadPoolExecutor(max_workers=max(1, concurrency))
+    try:
+        if batch_size > 1:
+            futures = [
+                executor.submit(synthesizer.synthesize_many, chunks[start : start + batch_size])
+                for start in range(0, len(chunks), batch_size)
+            ]
+            unit = "batch"
+        else:
+            futures = [executor.submit(synthesizer.synthesize_cached, chunk) for chunk in chunks]
+            unit = "chunk"
+        for future in tqdm(
+            as_completed(futures),
+            total=len(futures),
+            desc="Synthesizing",
+            unit=unit,
+            disable=not show_progress,
+        ):
+            # Surface the first failure instead of discovering it during assembly.
+            future.result()
+    finally:
+        # After a failure, drop the queued requests rather than paying for them.
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def resolve_output_path(args: argparse.Namespace, config: AppConfig) -> Path:
+    """Determine output path with job-based naming and make sure its directory exists."""
     if args.out:
         output_path = Path(args.out)
     else:
         default_output_name = os.getenv("TTS_OUTPUT_PATH", "voiceover.mp3")
         output_base_name = Path(default_output_name).name
         output_dir = Path("output")
-        output_dir.mkdir(parents=True, exist_ok=True)
-        
+
         # Format: {job_name}-{provider}-{base_output_filename}
         output_filename = f"{config.job_name}-{config.provider}-{output_base_name}"
         output_path = output_dir / output_filename
-    
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_format = output_path.suffix.lstrip(".") or synthesizer.output_format
-    final_audio.export(output_path, format=output_format)
 
-    print(f"Done: {output_path}")
-    return 0
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    return output_path
 
 
 def main() -> None: